@@ -1,4 +1,10 @@
-from core.contracts import DataSink, PipelineService, DataRecord
+from core.contracts import (
+    DataSink,
+    PipelineService,
+    DataRecord,
+    DataRecordDict,
+    DataRecordTuple,
+)
 
-__all__ = ['DataSink', 'PipelineService', 'DataRecord']
+__all__ = ['DataSink', 'PipelineService', 'DataRecord', 'DataRecordDict', 'DataRecordTuple']
 
@@ -7,6 +7,8 @@ from typing import (
     Any,
     Optional,
     Tuple,
+    NamedTuple,
+    TypedDict,
     runtime_checkable,
 )
 
@@ -24,6 +26,19 @@ class DataRecord(Protocol):
     def gdp_values(self) -> Dict[int, float]: ...
 
 
+class DataRecordDict(TypedDict):
+    country_name: str
+    continent: str
+    gdp_values: Dict[int, float]
+
+
+class DataRecordTuple(NamedTuple):
+    """Fast-path DataRecord: tuple-backed fields, no per-instance __dict__."""
+    country_name: str
+    continent: str
+    gdp_values: Dict[int, float]
+
+
 @runtime_checkable
 class DataSink(Protocol):
 
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from typing import List, Dict, Any, Optional
-from functools import reduce
+from math import fsum
+from bisect import bisect_left, bisect_right
 
 import numpy as np
 import pandas as pd
@@ -15,21 +16,46 @@ _year_keys = lambda row: sorted(filter(lambda k: isinstance(k, int), row.keys())
 
 
 def _raw_to_df(raw_data: List[Dict[str, Any]]) -> pd.DataFrame:
-    return pd.DataFrame(raw_data)
+    df = pd.DataFrame(raw_data)
+    for col in ('Country Name', 'Continent'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
 
 
 def _resolve_years(df: pd.DataFrame, date_range: List[int]) -> List[int]:
     all_years = sorted(filter(lambda c: isinstance(c, int), df.columns))
     start, end = date_range[0], date_range[1]
-    return list(filter(lambda y: start <= y <= end, all_years))
+    return all_years[bisect_left(all_years, start):bisect_right(all_years, end)]
 
 
 def _continent_df(df: pd.DataFrame, continent: str) -> pd.DataFrame:
     return df[df['Continent'] == continent]
 
 
-def _all_continents(df: pd.DataFrame) -> List[str]:
-    return sorted(filter(pd.notna, df['Continent'].unique()))
+def _ranked_rows(ranked: pd.DataFrame, continent: str, year: int) -> List[Dict[str, Any]]:
+    return list(map(
+        lambda row: {
+            'rank': row[0],
+            'country': row[1][0],
+            'continent': continent,
+            'year': year,
+            'gdp': row[1][1],
+        },
+        enumerate(zip(ranked['Country Name'].tolist(), ranked[year].tolist()), 1),
+    ))
+
+
+def _params_key(params: Dict[str, Any]) -> Optional[tuple]:
+    key = tuple(sorted(map(
+        lambda kv: (kv[0], tuple(kv[1]) if isinstance(kv[1], list) else kv[1]),
+        params.items(),
+    )))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 
 class TransformationEngine:
@@ -50,6 +76,7 @@ class TransformationEngine:
         self.config: Dict[str, Any] = config or {}
         self.df: Optional[pd.DataFrame] = None
         self.year_columns: List[int] = []
+        self._results: Dict[tuple, Optional[List[Dict[str, Any]]]] = {}
 
         self._dispatch: Dict[str, Any] = {
             'top_countries':             self._top_countries,
@@ -67,6 +94,7 @@ class TransformationEngine:
         self.year_columns = sorted(
             filter(lambda c: isinstance(c, int), self.df.columns)
         )
+        self._results = {}
 
     def execute(self, raw_data: List[Dict[str, Any]]) -> None:
         self.load_data(raw_data)
@@ -91,7 +119,13 @@ class TransformationEngine:
         handler = self._dispatch.get(analysis_name)
         if handler is None:
             return None
-        return handler(params)
+        params_key = _params_key(params)
+        if params_key is None:
+            return handler(params)
+        key = (analysis_name, params_key)
+        if key not in self._results:
+            self._results[key] = handler(params)
+        return list(map(dict, self._results[key]))
 
     def _run_and_emit(self, name: str, params: Dict[str, Any]) -> None:
         results = self.run_analysis(name, params)
@@ -109,16 +143,7 @@ class TransformationEngine:
             return []
 
         top = cdf.nlargest(n, year)
-        return list(map(
-            lambda row: {
-                'rank': row[0],
-                'country': row[1][1]['Country Name'],
-                'continent': continent,
-                'year': year,
-                'gdp': row[1][1][year],
-            },
-            enumerate(top.iterrows(), 1),
-        ))
+        return _ranked_rows(top, continent, year)
 
     def _bottom_countries(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
         continent = params.get('continent', 'Asia')
@@ -131,16 +156,7 @@ class TransformationEngine:
 
         valid = cdf.dropna(subset=[year])
         bottom = valid.nsmallest(n, year)
-        return list(map(
-            lambda row: {
-                'rank': row[0],
-                'country': row[1][1]['Country Name'],
-                'continent': continent,
-                'year': year,
-                'gdp': row[1][1][year],
-            },
-            enumerate(bottom.iterrows(), 1),
-        ))
+        return _ranked_rows(bottom, continent, year)
 
     def _growth_rate(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
         continent = params.get('continent', 'Asia')
@@ -156,26 +172,25 @@ class TransformationEngine:
 
         first_year, last_year = years[0], years[-1]
 
-        def _country_growth(row_tuple):
-            _, row = row_tuple
-            first_val = row.get(first_year, np.nan)
-            last_val = row.get(last_year, np.nan)
-            if pd.isna(first_val) or pd.isna(last_val) or first_val == 0:
-                return None
-            growth = _safe_div(last_val - first_val, first_val) * 100
-            return {
-                'country': row['Country Name'],
+        first_vals = cdf[first_year].to_numpy(dtype=np.float64)
+        last_vals = cdf[last_year].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(first_vals) & ~np.isnan(last_vals) & (first_vals != 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth = np.where(valid, (last_vals - first_vals) / first_vals * 100, np.nan)
+
+        rows = np.flatnonzero(valid)
+        names = cdf['Country Name'].to_numpy()[rows].tolist()
+        results = list(map(
+            lambda k: {
+                'country': names[k],
                 'continent': continent,
                 'start_year': first_year,
                 'end_year': last_year,
-                'start_gdp': first_val,
-                'end_gdp': last_val,
-                'growth_pct': round(growth, 2),
-            }
-
-        results = list(filter(
-            lambda r: r is not None,
-            map(_country_growth, cdf.iterrows()),
+                'start_gdp': float(first_vals[rows[k]]),
+                'end_gdp': float(last_vals[rows[k]]),
+                'growth_pct': round(float(growth[rows[k]]), 2),
+            },
+            range(rows.size),
         ))
         return sorted(results, key=lambda r: r['growth_pct'], reverse=True)
 
@@ -185,29 +200,19 @@ class TransformationEngine:
         if not years:
             return []
 
-        continents = _all_continents(self.df)
+        grouped = self.df.groupby('Continent', observed=True)
+        means = grouped[years].mean()
+        sizes = grouped.size()
 
-        def _avg_for_continent(continent):
-            cdf = _continent_df(self.df, continent)
-            if cdf.empty:
-                return None
-            total = reduce(
-                lambda acc, y: acc + cdf[y].dropna().mean(),
-                years,
-                0.0,
-            )
-            avg = _safe_div(total, len(years))
-            return {
-                'continent': continent,
-                'avg_gdp': round(avg, 2),
+        return list(map(
+            lambda c: {
+                'continent': c,
+                'avg_gdp': round(_safe_div(fsum(means.loc[c]), len(years)), 2),
                 'start_year': years[0],
                 'end_year': years[-1],
-                'country_count': len(cdf),
-            }
-
-        return list(filter(
-            lambda r: r is not None,
-            map(_avg_for_continent, continents),
+                'country_count': int(sizes[c]),
+            },
+            means.index,
         ))
 
     def _global_gdp_trend(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -232,14 +237,10 @@ class TransformationEngine:
             return []
 
         first_year, last_year = years[0], years[-1]
-        continents = _all_continents(self.df)
+        totals = self.df.groupby('Continent', observed=True)[[first_year, last_year]].sum()
 
-        def _continent_growth(continent):
-            cdf = _continent_df(self.df, continent)
-            if cdf.empty:
-                return None
-            first_total = cdf[first_year].dropna().sum()
-            last_total = cdf[last_year].dropna().sum()
+        def _continent_growth(item):
+            continent, first_total, last_total = item
             if first_total == 0:
                 return None
             growth = _safe_div(last_total - first_total, first_total) * 100
@@ -254,7 +255,7 @@ class TransformationEngine:
 
         results = list(filter(
             lambda r: r is not None,
-            map(_continent_growth, continents),
+            map(_continent_growth, zip(totals.index, totals[first_year], totals[last_year])),
         ))
         return sorted(results, key=lambda r: r['growth_pct'], reverse=True)
 
@@ -267,30 +268,31 @@ class TransformationEngine:
 
         check_years = all_years[-decline_years:]
 
-        def _is_declining(row_tuple):
-            _, row = row_tuple
-            vals = list(map(lambda y: row.get(y, np.nan), check_years))
-            if any(map(pd.isna, vals)):
-                return None
-            pairs = list(zip(vals[:-1], vals[1:]))
-            all_declining = all(map(lambda p: p[1] < p[0], pairs))
-            if not all_declining:
-                return None
-            total_decline = _safe_div(vals[-1] - vals[0], vals[0]) * 100 if vals[0] != 0 else 0
-            return {
-                'country': row['Country Name'],
-                'continent': row.get('Continent', 'N/A'),
+        values = self.df[check_years].to_numpy(dtype=np.float64)
+        declining = (np.diff(values, axis=1) < 0).all(axis=1) & ~np.isnan(values).any(axis=1)
+        rows = np.flatnonzero(declining)
+
+        names = self.df['Country Name'].to_numpy()
+        continents = (
+            self.df['Continent'].to_numpy() if 'Continent' in self.df.columns
+            else np.full(len(self.df), 'N/A', dtype=object)
+        )
+        start_vals, end_vals = values[rows, 0], values[rows, -1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            decline_pct = np.where(start_vals != 0, (end_vals - start_vals) / start_vals * 100, 0.0)
+
+        results = list(map(
+            lambda k: {
+                'country': names[rows[k]],
+                'continent': continents[rows[k]],
                 'decline_years': decline_years,
                 'start_year': check_years[0],
                 'end_year': check_years[-1],
-                'start_gdp': vals[0],
-                'end_gdp': vals[-1],
-                'decline_pct': round(total_decline, 2),
-            }
-
-        results = list(filter(
-            lambda r: r is not None,
-            map(_is_declining, self.df.iterrows()),
+                'start_gdp': float(start_vals[k]),
+                'end_gdp': float(end_vals[k]),
+                'decline_pct': round(float(decline_pct[k]), 2),
+            },
+            range(rows.size),
         ))
         return sorted(results, key=lambda r: r['decline_pct'])
 
@@ -300,26 +302,15 @@ class TransformationEngine:
         if not years:
             return []
 
-        continents = _all_continents(self.df)
-
-        global_total = reduce(
-            lambda acc, y: acc + self.df[y].dropna().sum(),
-            years,
-            0.0,
-        )
+        global_total = fsum(map(lambda y: self.df[y].dropna().sum(), years))
 
         if global_total == 0:
             return []
 
+        totals = self.df.groupby('Continent', observed=True)[years].sum()
+
         def _contrib(continent):
-            cdf = _continent_df(self.df, continent)
-            if cdf.empty:
-                return None
-            cont_total = reduce(
-                lambda acc, y: acc + cdf[y].dropna().sum(),
-                years,
-                0.0,
-            )
+            cont_total = fsum(totals.loc[continent])
             pct = _safe_div(cont_total, global_total) * 100
             return {
                 'continent': continent,
@@ -330,9 +321,6 @@ class TransformationEngine:
                 'end_year': years[-1],
             }
 
-        results = list(filter(
-            lambda r: r is not None,
-            map(_contrib, continents),
-        ))
+        results = list(map(_contrib, totals.index))
         return sorted(results, key=lambda r: r['contribution_pct'], reverse=True)
 
@@ -1,11 +1,76 @@
-import pandas as pd
 import json
 import os
-from functools import reduce
+
+try:
+    import cysimdjson
+    _simdjson_parser = cysimdjson.JSONParser()
+    _json_loads = lambda data: _simdjson_parser.parse(data).export()
+except ImportError:
+    try:
+        import orjson
+        _json_loads = orjson.loads
+    except ImportError:
+        _json_loads = json.loads
+
+from importlib.util import find_spec
+
+_EXCEL_ENGINE = 'calamine' if find_spec('python_calamine') is not None else None
+_HAS_PYARROW = find_spec('pyarrow') is not None
+
+
+def _read_csv(file_path):
+    import pandas as pd
+    if not _HAS_PYARROW:
+        return pd.read_csv(file_path)
+    from pyarrow import csv as pa_csv
+    # Dictionary-encoded string columns arrive in pandas as categoricals.
+    table = pa_csv.read_csv(
+        file_path,
+        convert_options=pa_csv.ConvertOptions(auto_dict_encode=True),
+    )
+    return table.to_pandas()
+
+
+def _source_stamp(file_path):
+    st = os.stat(file_path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def _sidecar_is_fresh(file_path, cache_path):
+    try:
+        with open(cache_path + '.stamp', encoding='utf-8') as f:
+            stamp = f.read()
+    except OSError:
+        return False
+    return stamp == _source_stamp(file_path) and os.path.exists(cache_path)
+
+
+def _read_excel(file_path):
+    import pandas as pd
+    if not _HAS_PYARROW:
+        return pd.read_excel(file_path, engine=_EXCEL_ENGINE)
+    
+    # Parquet sidecar, reused only while the workbook's size and mtime match its stamp.
+    cache_path = file_path + '.parquet'
+    if _sidecar_is_fresh(file_path, cache_path):
+        df = pd.read_parquet(cache_path)
+        df.columns = [int(col) if col.isdigit() else col for col in df.columns]
+        return df
+    
+    df = pd.read_excel(file_path, engine=_EXCEL_ENGINE)
+    try:
+        df.rename(columns=str).to_parquet(cache_path, index=False)
+        with open(cache_path + '.stamp', 'w', encoding='utf-8') as f:
+            f.write(_source_stamp(file_path))
+    except (OSError, ValueError, TypeError):
+        pass
+    return df
 
 
 class ConfigLoader:
     
+    _CACHE = {}
+    
     def __init__(self, config_path='config.json'):
         self.config_path = config_path
         self.config = self._load_config()
@@ -14,10 +79,20 @@ class ConfigLoader:
         if not os.path.exists(self.config_path):
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
+        # Keep the raw bytes only; each loader parses its own config dict.
+        path = os.path.abspath(self.config_path)
+        mtime = os.stat(path).st_mtime_ns
+        cached = type(self)._CACHE.get(path)
+        
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            if cached is not None and cached[0] == mtime:
+                data = cached[1]
+            else:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                type(self)._CACHE[path] = (mtime, data)
             
+            config = _json_loads(data)
             self._validate_config(config)
             return config
         
@@ -29,13 +104,13 @@ class ConfigLoader:
     def _validate_config(self, config):
         required_sections = ['data', 'ui', 'colors', 'analysis_types', 'visualization']
         
-        missing_sections = list(filter(lambda section: section not in config, required_sections))
+        missing_sections = [s for s in required_sections if s not in config]
         
         if missing_sections:
             raise ValueError(f"Missing required configuration section: {', '.join(missing_sections)}")
         
         data_required = ['file_path', 'required_columns']
-        missing_data_fields = list(filter(lambda key: key not in config['data'], data_required))
+        missing_data_fields = [f for f in data_required if f not in config['data']]
         
         if missing_data_fields:
             raise ValueError(f"Missing in data configuration: {', '.join(missing_data_fields)}")
@@ -68,10 +143,10 @@ class GDPDataLoader:
         
         try:
             if file_extension == '.csv':
-                self.df = pd.read_csv(file_path)
+                self.df = _read_csv(file_path)
                 print(f"Loaded CSV file: {file_path}")
             elif file_extension in ['.xlsx', '.xls']:
-                self.df = pd.read_excel(file_path)
+                self.df = _read_excel(file_path)
                 print(f"Loaded Excel file: {file_path}")
             else:
                 raise ValueError(
@@ -81,6 +156,8 @@ class GDPDataLoader:
         except Exception as e:
             raise Exception(f"Failed to read data file ({file_extension}): {str(e)}")
         
+        self.df.columns = [int(col) if str(col).isdigit() else col for col in self.df.columns]
+        
         self._validate_data()
         self._extract_metadata()
         
@@ -91,7 +168,7 @@ class GDPDataLoader:
             raise ValueError("Loaded data is empty")
         
         required_columns = self.config.get('data', 'required_columns')
-        missing_columns = list(filter(lambda col: col not in self.df.columns, required_columns))
+        missing_columns = [col for col in required_columns if col not in self.df.columns]
         
         if missing_columns:
             raise ValueError(
@@ -99,21 +176,18 @@ class GDPDataLoader:
                 f"Available columns: {', '.join(map(str, self.df.columns))}"
             )
         
-        year_cols = list(filter(lambda col: isinstance(col, int), self.df.columns))
-        if not year_cols:
+        self.year_columns = [col for col in self.df.columns if isinstance(col, int)]
+        if not self.year_columns:
             raise ValueError("No year columns found in data (expected numeric column names)")
     
     def _extract_metadata(self):
-        self.year_columns = sorted(
-            list(filter(lambda col: isinstance(col, int), self.df.columns))
-        )
+        self.year_columns.sort()
         
-        self.countries = sorted(
-            list(filter(lambda country: pd.notna(country), self.df['Country Name'].unique()))
-        )
+        self.df['Country Name'] = self.df['Country Name'].astype('category')
+        self.df['Continent'] = self.df['Continent'].astype('category')
         
-        continents_raw = self.df['Continent'].dropna().unique()
-        self.continents = sorted(list(map(str, filter(lambda x: pd.notna(x), continents_raw))))
+        self.countries = sorted(self.df['Country Name'].cat.categories.dropna().tolist())
+        self.continents = sorted(str(c) for c in self.df['Continent'].cat.categories.dropna())
         
         if not self.countries:
             raise ValueError("No countries found in data")
@@ -1,86 +1,304 @@
+import sys
+
 import numpy as np
 import pandas as pd
-from functools import reduce
-from itertools import combinations
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Frozen builds have no writable source tree for numba's on-disk cache.
+_JIT_CACHE = not getattr(sys, 'frozen', False)
+
+
+def _growth_series_numpy(values):
+    prev, curr = values[:-1], values[1:]
+    growth = np.subtract(curr, prev)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(growth, prev, out=growth)
+    np.multiply(growth, 100, out=growth)
+    growth[~np.isfinite(growth) | (prev == 0)] = np.nan
+    return growth
+
+
+def _pairwise_corr_numpy(sub):
+    present = ~np.isnan(sub)
+    weights = present.astype(np.float64)
+    filled = np.where(present, sub, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = filled.sum(axis=1, keepdims=True) / weights.sum(axis=1, keepdims=True)
+    centred = np.where(present, filled - means, 0.0)
+    squares = centred * centred
+    
+    n = weights @ weights.T
+    sum_x = centred @ weights.T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = centred @ centred.T - sum_x * sum_x.T / n
+        var_x = squares @ weights.T - sum_x * sum_x / n
+        corr = cov / np.sqrt(var_x * var_x.T)
+    corr[n < 2] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+if njit is not None:
+    @njit(cache=_JIT_CACHE)
+    def _growth_series(values):
+        out = np.empty(max(values.size - 1, 0))
+        for j in range(values.size - 1):
+            prev = values[j]
+            curr = values[j + 1]
+            if prev == prev and curr == curr and prev != 0:
+                out[j] = (curr - prev) / prev * 100
+            else:
+                out[j] = np.nan
+        return out
+    
+    @njit(cache=_JIT_CACHE)
+    def _series_stats(values):
+        valid = values[~np.isnan(values)]
+        count = valid.size
+        if count == 0:
+            return 0, np.nan, np.nan, np.nan, np.nan, np.nan
+        
+        low = high = valid[0]
+        total = 0.0
+        for v in valid:
+            low = min(low, v)
+            high = max(high, v)
+            total += v
+        mean = total / count
+        
+        spread = 0.0
+        for v in valid:
+            spread += (v - mean) * (v - mean)
+        return count, high, low, mean, np.median(valid), np.sqrt(spread / count)
+    
+    @njit(parallel=True, cache=_JIT_CACHE)
+    def _pairwise_corr(sub):
+        rows, cols = sub.shape
+        out = np.empty((rows, rows))
+        for i in prange(rows):
+            for j in range(i + 1):
+                n = 0
+                sum_x = 0.0
+                sum_y = 0.0
+                for k in range(cols):
+                    x = sub[i, k]
+                    y = sub[j, k]
+                    if x == x and y == y:
+                        n += 1
+                        sum_x += x
+                        sum_y += y
+                
+                corr = np.nan
+                if n >= 2:
+                    mean_x = sum_x / n
+                    mean_y = sum_y / n
+                    sxx = 0.0
+                    syy = 0.0
+                    sxy = 0.0
+                    for k in range(cols):
+                        x = sub[i, k]
+                        y = sub[j, k]
+                        if x == x and y == y:
+                            dx = x - mean_x
+                            dy = y - mean_y
+                            sxx += dx * dx
+                            syy += dy * dy
+                            sxy += dx * dy
+                    denom = np.sqrt(sxx * syy)
+                    if denom > 0:
+                        corr = min(max(sxy / denom, -1.0), 1.0)
+                out[i, j] = corr
+                out[j, i] = corr
+        return out
+else:
+    _growth_series = _growth_series_numpy
+    
+    def _series_stats(values):
+        valid = values[~np.isnan(values)]
+        if valid.size == 0:
+            return 0, np.nan, np.nan, np.nan, np.nan, np.nan
+        return valid.size, valid.max(), valid.min(), valid.mean(), np.median(valid), valid.std()
+    
+    _pairwise_corr = _pairwise_corr_numpy
 
 class GDPDataProcessor:
     
     def __init__(self, df, year_columns):
         self.df = df
         self.year_columns = year_columns
+        
+        self._country_idx = {name: i for i, name in enumerate(df['Country Name'].to_numpy())}
+        self._year_idx = {year: j for j, year in enumerate(year_columns)}
+        self._continents = df['Continent'].to_numpy()
+        self._year_matrix = df[year_columns].to_numpy(dtype=np.float64, copy=True)
+        self._year_matrix.flags.writeable = False
+        self._year_matrix32 = self._year_matrix.astype(np.float32)
+        
+        self._by_continent = {
+            name: group for name, group in df.groupby('Continent', sort=False, observed=True)
+        }
+        
+        codes, continents = pd.factorize(df['Continent'])
+        onehot = (codes == np.arange(len(continents))[:, None]).astype(np.float64)
+        present = ~np.isnan(self._year_matrix)
+        continent_index = pd.Index(np.asarray(continents), name='Continent')
+        self._continent_year_sum = pd.DataFrame(
+            onehot @ np.where(present, self._year_matrix, 0.0),
+            index=continent_index, columns=year_columns
+        )
+        self._continent_year_count = pd.DataFrame(
+            (onehot @ present).astype(np.int64),
+            index=continent_index, columns=year_columns
+        )
+        
+        self._corr_cache = {}
+        self._rank_cache = {}
+        self._continent_summary_cache = {}
+        self._world_stats_cache = {}
+    
+    def _year_positions(self, years):
+        cols = [self._year_idx[y] for y in years]
+        if cols and cols == list(range(cols[0], cols[-1] + 1)):
+            return slice(cols[0], cols[-1] + 1)
+        return cols
+    
+    def _gather(self, matrix, rows, years):
+        positions = self._year_positions(years)
+        if isinstance(positions, slice):
+            return matrix[rows, positions]
+        return matrix[np.ix_(rows, positions)]
     
     def get_country_data(self, country, years):
-        country_data = self.df[self.df['Country Name'] == country]
-        if country_data.empty:
+        i = self._country_idx.get(country)
+        if i is None:
             return None
-        return country_data[years].values.flatten()
+        return self._year_matrix[i, self._year_positions(years)]
+    
+    def get_countries_data(self, countries, years):
+        found = [c for c in dict.fromkeys(countries) if c in self._country_idx]
+        rows = [self._country_idx[c] for c in found]
+        return found, self._gather(self._year_matrix, rows, years)
+    
+    def get_country_continent(self, country):
+        i = self._country_idx.get(country)
+        if i is None:
+            return None
+        return self._continents[i]
     
     def get_continent_data(self, continent):
-        return self.df[self.df['Continent'] == continent]
+        group = self._by_continent.get(continent)
+        if group is None:
+            return self.df.iloc[0:0].copy()
+        return group.copy()
     
     def calculate_growth_rates(self, gdp_values, years):
-        value_pairs = list(zip(gdp_values[:-1], gdp_values[1:]))
-        year_pairs = list(zip(years[:-1], years[1:]))
-        
-        growth_data = list(map(
-            lambda pair_idx: (
-                ((value_pairs[pair_idx][1] - value_pairs[pair_idx][0]) / value_pairs[pair_idx][0]) * 100,
-                year_pairs[pair_idx][1]
-            ) if not np.isnan(value_pairs[pair_idx][0]) and not np.isnan(value_pairs[pair_idx][1]) and value_pairs[pair_idx][0] != 0
-            else (None, year_pairs[pair_idx][1]),
-            range(len(value_pairs))
-        ))
-        
-        valid_growth = list(filter(lambda x: x[0] is not None, growth_data))
+        values = np.asarray(gdp_values, dtype=np.float64)
+        years = np.asarray(years)
+        growth = _growth_series(values)
         
-        growth_rates = list(map(lambda x: x[0], valid_growth))
-        growth_years = list(map(lambda x: x[1], valid_growth))
-        
-        return growth_rates, growth_years
+        valid = np.isfinite(growth)
+        return growth[valid].tolist(), years[1:][valid].tolist()
+    
+    def _year_ranking(self, year):
+        # Same order as nlargest: values descending, then missing rows in row order.
+        order = self._rank_cache.get(year)
+        if order is None:
+            column = self._year_matrix[:, self._year_idx[year]]
+            missing = np.isnan(column)
+            valid = np.flatnonzero(~missing)
+            order = self._rank_cache[year] = np.concatenate([
+                valid[np.argsort(-column[valid], kind='stable')], np.flatnonzero(missing)
+            ])
+        return order
     
     def get_top_countries(self, year, n=10):
-        return self.df.nlargest(n, year)
+        return self.df.iloc[self._year_ranking(year)[:max(n, 0)]]
+    
+    def get_top_in_continent(self, continent, year, n=10):
+        key = (continent, year)
+        order = self._rank_cache.get(key)
+        if order is None:
+            ranking = self._year_ranking(year)
+            order = self._rank_cache[key] = ranking[self._continents[ranking] == continent]
+        return self.df.iloc[order[:max(n, 0)]]
+    
+    def _matrix_block(self, data, years):
+        # Only the processor's own frame is known to match its matrix.
+        if data is not self.df:
+            return None
+        return self._year_matrix32[:, self._year_positions(years)]
     
     def calculate_total_gdp(self, data, years):
-        return data[years].sum()
+        block = self._matrix_block(data, years)
+        if block is None:
+            return data[years].sum()
+        return pd.Series(np.nansum(block, axis=0, dtype=np.float64), index=years)
     
     def calculate_average_gdp(self, data, years):
-        return data[years].mean(axis=1)
+        block = self._matrix_block(data, years)
+        if block is None:
+            return data[years].mean(axis=1)
+        totals = np.nansum(block, axis=1, dtype=np.float64)
+        counts = np.count_nonzero(~np.isnan(block), axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return pd.Series(totals / counts, index=data.index)
     
     def get_correlation_matrix(self, countries, years):
-        country_data_pairs = list(filter(
-            lambda pair: pair[1] is not None,
-            map(lambda c: (c, self.get_country_data(c, years)), countries)
-        ))
+        found = [c for c in dict.fromkeys(countries) if c in self._country_idx]
+        
+        if not found:
+            return None
         
-        if not country_data_pairs:
+        key = (tuple(found), tuple(years))
+        cached = self._corr_cache.get(key)
+        if cached is not None:
+            return cached.copy()
+        
+        rows = [self._country_idx[c] for c in found]
+        sub = self._gather(self._year_matrix, rows, years)
+        
+        if np.isnan(sub).all():
             return None
         
-        data_dict = dict(country_data_pairs)
-        corr_df = pd.DataFrame(data_dict)
-        return corr_df.corr()
+        if np.isfinite(sub).all():
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr = np.atleast_2d(np.corrcoef(sub))
+            result = pd.DataFrame(corr, index=found, columns=found)
+        else:
+            result = pd.DataFrame(_pairwise_corr(sub), index=found, columns=found)
+        
+        self._corr_cache[key] = result
+        return result.copy()
     
     def calculate_statistics(self, gdp_values):
-        valid_gdp = list(filter(lambda g: not np.isnan(g), gdp_values))
+        count, high, low, mean, median, std = _series_stats(np.asarray(gdp_values, dtype=np.float64))
         
-        if not valid_gdp:
+        if count == 0:
             return None
         
         return {
-            'max': reduce(lambda a, b: a if a > b else b, valid_gdp),
-            'min': reduce(lambda a, b: a if a < b else b, valid_gdp),
-            'mean': reduce(lambda a, b: a + b, valid_gdp) / len(valid_gdp),
-            'median': np.median(valid_gdp),
-            'std': np.std(valid_gdp),
-            'count': len(valid_gdp)
+            'max': float(high),
+            'min': float(low),
+            'mean': float(mean),
+            'median': float(median),
+            'std': float(std),
+            'count': int(count)
         }
     
     def calculate_growth_summary(self, gdp_values, years):
-        first_valid = next((g for g in gdp_values if not np.isnan(g)), None)
-        last_valid = next((g for g in reversed(gdp_values) if not np.isnan(g)), None)
+        values = np.asarray(gdp_values, dtype=np.float64)
+        valid_idx = np.flatnonzero(np.isfinite(values))
         
-        if not first_valid or not last_valid or first_valid == 0:
+        if valid_idx.size == 0:
+            return None
+        
+        first_valid = values[valid_idx[0]].item()
+        last_valid = values[valid_idx[-1]].item()
+        
+        if first_valid == 0:
             return None
         
         total_growth = ((last_valid - first_valid) / first_valid) * 100
@@ -97,51 +315,93 @@ class GDPDataProcessor:
         
         return result
     
+    def get_continent_totals(self, continent, years):
+        if continent not in self._continent_year_sum.index:
+            return pd.Series(0.0, index=years)
+        return self._continent_year_sum.loc[continent, years]
+    
     def get_continent_summary(self, continent, year):
-        continent_data = self.get_continent_data(continent)
+        key = (continent, year)
+        if key not in self._continent_summary_cache:
+            group = self._by_continent.get(continent)
+            
+            if group is None:
+                summary = None
+            else:
+                total = self._continent_year_sum.at[continent, year]
+                count = self._continent_year_count.at[continent, year]
+                summary = {
+                    'total_gdp': total,
+                    'avg_gdp': total / count if count else np.nan,
+                    'country_count': len(group),
+                    'top_countries': self.get_top_in_continent(continent, year, 5)
+                }
+            
+            self._continent_summary_cache[key] = summary
         
-        if continent_data.empty:
+        summary = self._continent_summary_cache[key]
+        if summary is None:
             return None
-        
-        return {
-            'total_gdp': continent_data[year].sum(),
-            'avg_gdp': continent_data[year].mean(),
-            'country_count': len(continent_data),
-            'top_countries': continent_data.nlargest(5, year)
-        }
+        return dict(summary, top_countries=summary['top_countries'].copy())
     
     def get_world_statistics(self, year):
-        year_data = self.df[year].dropna()
+        cached = self._world_stats_cache.get(year)
+        if cached is not None:
+            return dict(cached)
         
-        return {
-            'total_gdp': year_data.sum(),
-            'avg_gdp': year_data.mean(),
-            'median_gdp': year_data.median(),
-            'std_gdp': year_data.std(),
-            'max_gdp': year_data.max(),
-            'min_gdp': year_data.min(),
-            'country_count': len(year_data)
-        }
+        column = self._year_matrix[:, self._year_idx[year]]
+        values = column[~np.isnan(column)]
+        count = values.size
+        
+        if count:
+            total = values.sum()
+            mean = total / count
+            std = np.sqrt(np.square(values - mean).sum() / (count - 1)) if count > 1 else np.nan
+            stats = {
+                'total_gdp': total,
+                'avg_gdp': mean,
+                'median_gdp': np.median(values),
+                'std_gdp': std,
+                'max_gdp': values.max(),
+                'min_gdp': values.min(),
+                'country_count': count
+            }
+        else:
+            stats = {
+                'total_gdp': 0.0,
+                'avg_gdp': np.nan,
+                'median_gdp': np.nan,
+                'std_gdp': np.nan,
+                'max_gdp': np.nan,
+                'min_gdp': np.nan,
+                'country_count': 0
+            }
+        
+        self._world_stats_cache[year] = stats
+        return dict(stats)
     
     def get_year_comparison_data(self, comparison_years, continents):
-        return dict(map(
-            lambda year: (year, dict(map(
-                lambda continent: (continent, self.get_continent_data(continent)[year].sum()),
-                continents
-            ))),
-            comparison_years
-        ))
+        sums = self._continent_year_sum[list(comparison_years)].to_dict()
+        return {
+            year: {continent: float(sums[year].get(continent, 0.0)) for continent in continents}
+            for year in comparison_years
+        }
     
     def get_top_correlations(self, correlation_matrix, n=10):
-        countries = correlation_matrix.columns
+        matrix = correlation_matrix.to_numpy()
+        rows, cols = np.triu_indices_from(matrix, k=1)
+        values = matrix[rows, cols]
+        
+        k = min(n, values.size)
+        if k <= 0:
+            return []
         
-        correlations = list(map(
-            lambda pair: (pair[0], pair[1], correlation_matrix.loc[pair[0], pair[1]]),
-            combinations(countries, 2)
-        ))
+        strength = -np.abs(values)
+        top = np.argpartition(strength, k - 1)[:k]
+        top = top[np.argsort(strength[top], kind='stable')]
         
-        sorted_correlations = sorted(correlations, key=lambda x: abs(x[2]), reverse=True)
-        return sorted_correlations[:n]
+        countries = correlation_matrix.columns.to_numpy()
+        return [(countries[rows[t]], countries[cols[t]], float(values[t])) for t in top]
 
 
 def filter_by_region(df, region):
@@ -156,47 +416,46 @@ def filter_by_country(df, country):
 def calculate_regional_average(df, region, year_columns):
     region_data = filter_by_region(df, region)
     
-    year_totals = list(map(lambda year: region_data[year].sum(), year_columns))
-    valid_totals = list(filter(lambda x: x > 0, year_totals))
+    year_totals = region_data[year_columns].to_numpy(dtype=np.float64, na_value=0.0).sum(axis=0)
+    valid_totals = year_totals[year_totals > 0]
     
-    if valid_totals:
-        return reduce(lambda a, b: a + b, valid_totals) / len(valid_totals)
+    if valid_totals.size:
+        return float(valid_totals.mean())
     return 0
 
 
 def calculate_regional_sum(df, region, year_columns):
     region_data = filter_by_region(df, region)
     
-    return reduce(
-        lambda total, year: total + region_data[year].sum(),
-        year_columns,
-        0
-    )
+    return float(region_data[year_columns].to_numpy(dtype=np.float64, na_value=0.0).sum())
 
 
-def calculate_country_average(df, country, year_columns):
+def _country_values(df, country, year_columns):
     country_data = filter_by_country(df, country)
     
     if country_data.empty:
+        return None
+    
+    return country_data[year_columns].to_numpy(dtype=np.float64)[0]
+
+
+def calculate_country_average(df, country, year_columns):
+    gdp_values = _country_values(df, country, year_columns)
+    
+    if gdp_values is None:
         return 0
     
-    gdp_values = list(map(lambda year: country_data[year].iloc[0], year_columns))
-    valid_values = list(filter(lambda x: x > 0, gdp_values))
+    valid_values = gdp_values[gdp_values > 0]
     
-    if valid_values:
-        return reduce(lambda a, b: a + b, valid_values) / len(valid_values)
+    if valid_values.size:
+        return float(valid_values.mean())
     return 0
 
 
 def calculate_country_sum(df, country, year_columns):
-    country_data = filter_by_country(df, country)
+    gdp_values = _country_values(df, country, year_columns)
     
-    if country_data.empty:
+    if gdp_values is None:
         return 0
     
-    return reduce(
-        lambda total, year: total + country_data[year].iloc[0],
-        year_columns,
-        0
-    )
-
+    return float(gdp_values[~np.isnan(gdp_values)].sum())
@@ -3,7 +3,9 @@
 import streamlit as st
 import numpy as np
 import pandas as pd
-from functools import reduce
+from math import fsum
+from bisect import bisect_left, bisect_right
+from itertools import cycle, islice
 import warnings
 import plotly.graph_objects as go
 import plotly.express as px
@@ -314,6 +316,13 @@ _PLOTLY_TEMPLATE = dict(
 
 _PLOTLY_LAYOUT = _PLOTLY_TEMPLATE["layout"]
 
+_SUBPLOT_AXIS_STYLE = dict(gridcolor="#1e1e1e", linecolor="#2f3336", tickfont=dict(color="#71767b"))
+
+
+def _style_subplot_axes(fig) -> None:
+    fig.update_xaxes(**_SUBPLOT_AXIS_STYLE)
+    fig.update_yaxes(**_SUBPLOT_AXIS_STYLE)
+
 
 _format_gdp = lambda v: (
     f"${v / 1e12:.2f}T" if abs(v) >= 1e12 else
@@ -323,7 +332,7 @@ _format_gdp = lambda v: (
 )
 
 
-@st.cache_data(show_spinner=False)
+@st.cache_resource(show_spinner=False)
 def load_all_data():
     config = ConfigLoader()
     loader = GDPDataLoader(config)
@@ -354,10 +363,22 @@ if "engine" not in st.session_state:
 engine: TransformationEngine = st.session_state.engine
 
 
-_PALETTE = raw_config.get("colors", {}).get("chart_palette", [
+@st.cache_resource(show_spinner=False)
+def _palette_cycle(palette, length):
+    return tuple(islice(cycle(palette), length))
+
+
+_PALETTE = tuple(raw_config.get("colors", {}).get("chart_palette", [
     "#1d9bf0", "#00ba7c", "#f4212e", "#ffad1f",
     "#794bc4", "#ff7a00", "#17bf63", "#e0245e",
-])
+]))
+_PALETTE_CYCLE = _palette_cycle(_PALETTE, max(len(df), len(year_columns)))
+
+
+def _palette_colours(n):
+    if n <= len(_PALETTE_CYCLE):
+        return list(_PALETTE_CYCLE[:n])
+    return list(islice(cycle(_PALETTE), n))
 
 
 with st.sidebar:
@@ -459,7 +480,7 @@ with st.sidebar:
     if start_year > end_year:
         start_year, end_year = end_year, start_year
 
-    selected_years = list(filter(lambda y: start_year <= y <= end_year, year_columns))
+    selected_years = year_columns[bisect_left(year_columns, start_year):bisect_right(year_columns, end_year)]
 
     st.markdown("---")
 
@@ -516,7 +537,7 @@ def render_engine_results(results, title, label_key=None, value_key=None):
             fig = go.Figure(layout=_PLOTLY_LAYOUT)
             labels = rdf[label_key].astype(str).tolist()
             values = rdf[value_key].astype(float).tolist()
-            colours = list(map(lambda i: _PALETTE[i % len(_PALETTE)], range(len(labels))))
+            colours = _palette_colours(len(labels))
             fig.add_trace(go.Bar(
                 x=values, y=labels, orientation="h",
                 marker=dict(color=colours, line=dict(width=0)),
@@ -939,11 +960,16 @@ if analysis_choice == "Geographic Map":
                 pass
         return None
 
+    @st.cache_data(show_spinner=False)
+    def _iso_codes(names):
+        return {name: _get_iso(name) for name in names}
+
     all_map_countries = [country_var] + compare_countries
 
+    iso_codes = _iso_codes(tuple(countries))
     map_rows = []
     for c in countries:
-        iso = _get_iso(c)
+        iso = iso_codes[c]
         if iso is None:
             continue
         gdp_val = processor.get_country_data(c, [latest_year])
@@ -960,7 +986,7 @@ if analysis_choice == "Geographic Map":
                 "GDP": gdp_val[0],
                 "GDP_Formatted": _format_gdp(gdp_val[0]),
                 "Role": role,
-                "Continent": df[df["Country Name"] == c]["Continent"].values[0] if not df[df["Country Name"] == c].empty else "Unknown",
+                "Continent": processor.get_country_continent(c) or "Unknown",
             })
     map_df = pd.DataFrame(map_rows)
 
@@ -1127,7 +1153,7 @@ elif analysis_choice == "Country GDP Trend":
                 c1.metric("Maximum GDP", _format_gdp(stats['max']))
                 c2.metric("Average GDP", _format_gdp(stats['mean']))
                 c3.metric("Minimum GDP", _format_gdp(stats['min']))
-                growth = processor.calculate_growth_summary(gdp_values, list(map(int, selected_years)))
+                growth = processor.calculate_growth_summary(gdp_values, selected_years)
                 if growth:
                     g1, g2 = st.columns(2)
                     g1.metric("Total Growth", f"{growth['total_growth']:.2f}%")
@@ -1140,34 +1166,35 @@ elif analysis_choice == "Compare Countries":
     if len(all_compare) < 2:
         st.warning("Select at least one country from **Compare With** to compare.")
     else:
+        compare_names, compare_block = processor.get_countries_data(all_compare, selected_years)
+        compare_data = dict(zip(compare_names, compare_block))
         tab_chart, tab_stats = st.tabs(["Visualization", "Statistics"])
         with tab_chart:
             fig = go.Figure(layout=_PLOTLY_LAYOUT)
-            list(map(
-                lambda ic: fig.add_trace(go.Scatter(
+            compare_colours = _palette_colours(len(all_compare))
+            fig.add_traces(list(map(
+                lambda ic: go.Scatter(
                     x=selected_years,
-                    y=processor.get_country_data(ic[1], selected_years),
+                    y=compare_data[ic[1]],
                     mode="lines+markers",
                     name=f"{ic[1]} (Primary)" if ic[1] == country_var else ic[1],
-                    line=dict(color=_PALETTE[ic[0] % len(_PALETTE)], width=3 if ic[1] == country_var else 2),
+                    line=dict(color=compare_colours[ic[0]], width=3 if ic[1] == country_var else 2),
                     marker=dict(size=7 if ic[1] == country_var else 4),
-                )) if processor.get_country_data(ic[1], selected_years) is not None else None,
-                enumerate(all_compare),
-            ))
+                ),
+                filter(lambda ic: ic[1] in compare_data, enumerate(all_compare)),
+            )))
             fig.update_layout(title="GDP Comparison Between Countries", xaxis_title="Year", yaxis_title="GDP (USD)")
             st.plotly_chart(fig, width="stretch")
 
         with tab_stats:
-            rows = list(filter(
-                lambda r: r is not None,
-                map(
-                    lambda c: {
-                        "Country": c,
-                        f"GDP ({latest_year})": processor.get_country_data(c, [latest_year])[0] if processor.get_country_data(c, [latest_year]) is not None else None,
-                        "Avg GDP": float(np.nanmean(processor.get_country_data(c, selected_years))) if processor.get_country_data(c, selected_years) is not None else None,
-                    },
-                    all_compare,
-                ),
+            compare_avgs = dict(zip(compare_names, np.nanmean(compare_block, axis=1).tolist()))
+            rows = list(map(
+                lambda c: {
+                    "Country": c,
+                    f"GDP ({latest_year})": compare_data[c][-1] if c in compare_data else None,
+                    "Avg GDP": compare_avgs.get(c),
+                },
+                all_compare,
             ))
             st.dataframe(pd.DataFrame(rows), width="stretch", hide_index=True)
 
@@ -1186,7 +1213,7 @@ elif analysis_choice == "Continent Analysis":
                 f"GDP Distribution in {latest_year}",
             ], vertical_spacing=0.12, horizontal_spacing=0.10)
 
-            total_gdp = processor.calculate_total_gdp(continent_data, selected_years)
+            total_gdp = processor.get_continent_totals(continent_var, selected_years)
             fig.add_trace(go.Scatter(
                 x=selected_years, y=total_gdp.values, mode="lines+markers",
                 line=dict(color="#00ba7c", width=2.5),
@@ -1194,23 +1221,20 @@ elif analysis_choice == "Continent Analysis":
                 showlegend=False,
             ), row=1, col=1)
 
-            top_c = continent_data.nlargest(top_n, latest_year)
+            top_c = processor.get_top_in_continent(continent_var, latest_year, top_n)
             fig.add_trace(go.Bar(
                 y=top_c["Country Name"], x=top_c[latest_year], orientation="h",
-                marker=dict(color=list(map(lambda i: _PALETTE[i % len(_PALETTE)], range(len(top_c))))),
+                marker=dict(color=_palette_colours(len(top_c))),
                 showlegend=False,
                 text=list(map(_format_gdp, top_c[latest_year])), textposition="auto",
                 textfont=dict(color="#e7e9ea", size=10),
             ), row=1, col=2)
 
-            avg_gdp = processor.calculate_average_gdp(continent_data, selected_years)
-            cdata_avg = continent_data.copy()
-            cdata_avg["avg_gdp"] = avg_gdp
-            top_avg = cdata_avg.nlargest(top_n, "avg_gdp")
+            top_avg = processor.calculate_average_gdp(continent_data, selected_years).nlargest(top_n)
             fig.add_trace(go.Bar(
-                y=top_avg["Country Name"], x=top_avg["avg_gdp"], orientation="h",
+                y=continent_data.loc[top_avg.index, "Country Name"], x=top_avg, orientation="h",
                 marker=dict(color="#f4212e"), showlegend=False,
-                text=list(map(_format_gdp, top_avg["avg_gdp"])), textposition="auto",
+                text=list(map(_format_gdp, top_avg)), textposition="auto",
                 textfont=dict(color="#e7e9ea", size=10),
             ), row=2, col=1)
 
@@ -1227,13 +1251,7 @@ elif analysis_choice == "Continent Analysis":
                 font=dict(color="#e7e9ea"),
                 title_font=dict(color="#e7e9ea"),
             )
-            list(map(
-                lambda ax: fig.update_layout(**{
-                    f"xaxis{ax}": dict(gridcolor="#1e1e1e", linecolor="#2f3336", tickfont=dict(color="#71767b")),
-                    f"yaxis{ax}": dict(gridcolor="#1e1e1e", linecolor="#2f3336", tickfont=dict(color="#71767b")),
-                }),
-                ["", "2", "3", "4"],
-            ))
+            _style_subplot_axes(fig)
             st.plotly_chart(fig, width="stretch")
 
         with tab_stats:
@@ -1257,7 +1275,7 @@ elif analysis_choice == "Top Countries":
         fig = go.Figure(layout=_PLOTLY_LAYOUT)
         cnames = top_countries["Country Name"].values
         gdp_vals = top_countries[latest_year].values
-        colours = list(map(lambda i: _PALETTE[i % len(_PALETTE)], range(len(cnames))))
+        colours = _palette_colours(len(cnames))
         fig.add_trace(go.Bar(
             y=cnames, x=gdp_vals, orientation="h",
             marker=dict(color=colours, line=dict(width=0)),
@@ -1273,7 +1291,7 @@ elif analysis_choice == "Top Countries":
 
     with tab_stats:
         total_top = top_countries[latest_year].sum()
-        total_world = df[latest_year].sum()
+        total_world = world_stats['total_gdp']
         pct = (total_top / total_world) * 100
         s1, s2, s3 = st.columns(3)
         s1.metric("Combined GDP", _format_gdp(total_top))
@@ -1308,14 +1326,15 @@ elif analysis_choice == "GDP Growth Rate":
             st.plotly_chart(fig, width="stretch")
 
         with tab_stats:
-            valid_rates = list(filter(lambda r: not np.isnan(r), growth_rates))
-            if valid_rates:
+            valid_rates = np.asarray(growth_rates, dtype=np.float64)
+            valid_rates = valid_rates[~np.isnan(valid_rates)]
+            if valid_rates.size:
                 c1, c2, c3 = st.columns(3)
-                c1.metric("Avg Growth", f"{np.mean(valid_rates):.2f}%")
-                c2.metric("Max Growth", f"{max(valid_rates):.2f}%")
-                c3.metric("Min Growth", f"{min(valid_rates):.2f}%")
-                pos = len(list(filter(lambda r: r > 0, valid_rates)))
-                neg = len(list(filter(lambda r: r < 0, valid_rates)))
+                c1.metric("Avg Growth", f"{valid_rates.mean():.2f}%")
+                c2.metric("Max Growth", f"{valid_rates.max():.2f}%")
+                c3.metric("Min Growth", f"{valid_rates.min():.2f}%")
+                pos = int(np.count_nonzero(valid_rates > 0))
+                neg = int(np.count_nonzero(valid_rates < 0))
                 st.caption(f"Positive years: {pos}  ·  Negative years: {neg}")
 
 
@@ -1335,7 +1354,7 @@ elif analysis_choice == "Statistical Summary":
                 r2[0].metric("Average GDP", _format_gdp(stats['mean']))
                 r2[1].metric("Median GDP", _format_gdp(stats['median']))
                 r2[2].metric("Std Deviation", _format_gdp(stats['std']))
-                growth = processor.calculate_growth_summary(gdp_values, list(map(int, selected_years)))
+                growth = processor.calculate_growth_summary(gdp_values, selected_years)
                 if growth:
                     g1, g2 = st.columns(2)
                     g1.metric("Total Growth", f"{growth['total_growth']:.2f}%")
@@ -1390,12 +1409,13 @@ elif analysis_choice == "Year Comparison":
     tab_chart, tab_stats = st.tabs(["Visualization", "Statistics"])
     with tab_chart:
         fig = go.Figure(layout=_PLOTLY_LAYOUT)
+        year_colours = _palette_colours(len(comparison_years))
         list(map(
             lambda iy: fig.add_trace(go.Bar(
                 x=continents,
                 y=list(map(lambda c: comparison_data[iy[1]][c], continents)),
                 name=str(iy[1]),
-                marker=dict(color=_PALETTE[iy[0] % len(_PALETTE)]),
+                marker=dict(color=year_colours[iy[0]]),
             )),
             enumerate(comparison_years),
         ))
@@ -1458,10 +1478,8 @@ elif analysis_choice == "Regional Analysis (Pie + Bar)":
     phase1_ops = raw_config.get("phase1_operations", {})
     regions = phase1_ops.get("compute_regions", continents)
 
-    regional_pairs = list(filter(
-        lambda p: p[1] > 0,
-        map(lambda r: (r, df[df["Continent"] == r][latest_year].sum()), regions),
-    ))
+    regional_totals = processor.get_year_comparison_data([latest_year], regions)[latest_year]
+    regional_pairs = list(filter(lambda p: p[1] > 0, regional_totals.items()))
     region_names = list(map(lambda p: p[0], regional_pairs))
     gdp_vals = list(map(lambda p: p[1], regional_pairs))
 
@@ -1470,7 +1488,7 @@ elif analysis_choice == "Regional Analysis (Pie + Bar)":
         fig_pie = go.Figure(layout=_PLOTLY_LAYOUT)
         fig_pie.add_trace(go.Pie(
             labels=region_names, values=gdp_vals,
-            marker=dict(colors=list(map(lambda i: _PALETTE[i % len(_PALETTE)], range(len(region_names))))),
+            marker=dict(colors=_palette_colours(len(region_names))),
             textinfo="label+percent", textfont=dict(color="#e7e9ea"),
             hole=0.35,
         ))
@@ -1481,14 +1499,14 @@ elif analysis_choice == "Regional Analysis (Pie + Bar)":
         fig_bar = go.Figure(layout=_PLOTLY_LAYOUT)
         fig_bar.add_trace(go.Bar(
             x=region_names, y=gdp_vals,
-            marker=dict(color=list(map(lambda i: _PALETTE[i % len(_PALETTE)], range(len(region_names))))),
+            marker=dict(color=_palette_colours(len(region_names))),
             text=list(map(_format_gdp, gdp_vals)), textposition="auto",
             textfont=dict(color="#e7e9ea", size=11),
         ))
         fig_bar.update_layout(title=f"Regional GDP Comparison ({latest_year})", xaxis_title="Region", yaxis_title="GDP (USD)")
         st.plotly_chart(fig_bar, width="stretch")
 
-    total = reduce(lambda a, b: a + b, gdp_vals, 0)
+    total = fsum(gdp_vals)
     pcts = list(map(lambda g: g / total * 100, gdp_vals))
     stat_rows = list(map(
         lambda rg_p: {"Region": rg_p[0], "GDP": rg_p[1], "Share (%)": round(rg_p[2], 1)},
@@ -1517,7 +1535,7 @@ elif analysis_choice == "Year Analysis (Line + Scatter)":
 
         with col_scatter:
             fig2 = go.Figure(layout=_PLOTLY_LAYOUT)
-            colours = list(map(lambda i: _PALETTE[i % len(_PALETTE)], range(len(selected_years))))
+            colours = _palette_colours(len(selected_years))
             fig2.add_trace(go.Scatter(
                 x=selected_years, y=gdp_values, mode="markers",
                 marker=dict(size=12, color=colours, line=dict(color="#e7e9ea", width=0.5)),
@@ -1538,10 +1556,8 @@ elif analysis_choice == "Complete Analysis (All Charts)":
     phase1_ops = raw_config.get("phase1_operations", {})
     regions = phase1_ops.get("compute_regions", continents[:5])
 
-    regional_pairs = list(filter(
-        lambda p: p[1] > 0,
-        map(lambda r: (r, df[df["Continent"] == r][latest_year].sum()), regions),
-    ))
+    regional_totals = processor.get_year_comparison_data([latest_year], regions)[latest_year]
+    regional_pairs = list(filter(lambda p: p[1] > 0, regional_totals.items()))
     region_names = list(map(lambda p: p[0], regional_pairs))
     gdp_vals = list(map(lambda p: p[1], regional_pairs))
 
@@ -1561,13 +1577,13 @@ elif analysis_choice == "Complete Analysis (All Charts)":
 
     fig.add_trace(go.Pie(
         labels=region_names, values=gdp_vals,
-        marker=dict(colors=list(map(lambda i: _PALETTE[i % len(_PALETTE)], range(len(region_names))))),
+        marker=dict(colors=_palette_colours(len(region_names))),
         textinfo="label+percent", textfont=dict(color="#e7e9ea"), hole=0.3,
     ), row=1, col=1)
 
     fig.add_trace(go.Bar(
         x=region_names, y=gdp_vals,
-        marker=dict(color=list(map(lambda i: _PALETTE[i % len(_PALETTE)], range(len(region_names))))),
+        marker=dict(color=_palette_colours(len(region_names))),
         showlegend=False,
     ), row=1, col=2)
 
@@ -1581,7 +1597,7 @@ elif analysis_choice == "Complete Analysis (All Charts)":
         ), row=2, col=1)
 
     if gdp_values is not None:
-        scatter_colors = list(map(lambda i: _PALETTE[i % len(_PALETTE)], range(len(selected_years))))
+        scatter_colors = _palette_colours(len(selected_years))
         fig.add_trace(go.Scatter(
             x=selected_years, y=gdp_values, mode="markers",
             marker=dict(size=10, color=scatter_colors, line=dict(color="#e7e9ea", width=0.5)),
@@ -1594,13 +1610,7 @@ elif analysis_choice == "Complete Analysis (All Charts)":
         font=dict(color="#e7e9ea"),
         showlegend=False,
     )
-    list(map(
-        lambda ax: fig.update_layout(**{
-            f"xaxis{ax}": dict(gridcolor="#1e1e1e", linecolor="#2f3336", tickfont=dict(color="#71767b")),
-            f"yaxis{ax}": dict(gridcolor="#1e1e1e", linecolor="#2f3336", tickfont=dict(color="#71767b")),
-        }),
-        ["", "2", "3", "4"],
-    ))
+    _style_subplot_axes(fig)
     st.plotly_chart(fig, width="stretch")
 
     st.markdown("---")
@@ -1665,7 +1675,7 @@ elif analysis_choice == "Continent Contribution":
             fig = go.Figure(layout=_PLOTLY_LAYOUT)
             fig.add_trace(go.Pie(
                 labels=rdf["continent"], values=rdf["contribution_pct"],
-                marker=dict(colors=list(map(lambda i: _PALETTE[i % len(_PALETTE)], range(len(rdf))))),
+                marker=dict(colors=_palette_colours(len(rdf))),
                 textinfo="label+percent", textfont=dict(color="#e7e9ea"),
                 hole=0.4,
             ))
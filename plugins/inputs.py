@@ -8,6 +8,7 @@ import json
 import pandas as pd
 
 from core.contracts import PipelineService
+from data_loader import _read_csv, _read_excel
 
 
 _INT_COERCIBLE = lambda v: isinstance(v, (int, float)) and not isinstance(v, bool) and v == int(v)
@@ -42,7 +43,7 @@ class CsvReader:
     def read_and_push(self, service: PipelineService) -> None:
         if not os.path.exists(self.file_path):
             raise FileNotFoundError(f"CSV file not found: {self.file_path}")
-        df = pd.read_csv(self.file_path)
+        df = _read_csv(self.file_path)
         records = _df_to_records(df)
         service.execute(records)
 
@@ -69,7 +70,7 @@ class ExcelReader:
     def read_and_push(self, service: PipelineService) -> None:
         if not os.path.exists(self.file_path):
             raise FileNotFoundError(f"Excel file not found: {self.file_path}")
-        df = pd.read_excel(self.file_path)
+        df = _read_excel(self.file_path)
         records = _df_to_records(df)
         service.execute(records)
 
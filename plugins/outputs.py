@@ -4,11 +4,6 @@ from typing import List, Dict, Any, Optional
 from functools import reduce
 import os
 
-import matplotlib
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.ticker import FuncFormatter
 import numpy as np
 
 
@@ -22,6 +17,16 @@ _FORMAT_GDP = lambda v: (
 _SEPARATOR = "=" * 70
 _SUB_SEP = "-" * 70
 
+_CELL_FMT = "{:<20s}".format
+_CHART_ROW_FMT = "    {:<30s} {}".format
+_SUMMARY_ROW_FMT = "    {:<25s}: {}".format
+
+_TK_MARGINS = {
+    'bar': dict(left=0.22, right=0.96, top=0.9, bottom=0.1),
+    'line': dict(left=0.1, right=0.96, top=0.9, bottom=0.12),
+    'pie': dict(left=0.05, right=0.95, top=0.9, bottom=0.05),
+}
+
 
 class ConsoleWriter:
 
@@ -29,28 +34,25 @@ class ConsoleWriter:
         self.config = config or {}
 
     def write(self, records: List[Dict[str, Any]], title: str = "") -> None:
-        if title:
-            print(f"\n{_SEPARATOR}")
-            print(f"  {title.upper()}")
-            print(_SEPARATOR)
+        lines = [f"\n{_SEPARATOR}", f"  {title.upper()}", _SEPARATOR] if title else []
 
         if not records:
-            print("  No data available.\n")
+            lines.append("  No data available.\n")
+            print("\n".join(lines))
             return
 
         keys = list(records[0].keys())
-        header = "  ".join(map(lambda k: f"{k:<20s}", keys))
-        print(f"\n  {header}")
-        print(f"  {_SUB_SEP}")
-
-        list(map(
-            lambda rec: print("  " + "  ".join(map(
-                lambda k: f"{_format_value(rec.get(k, '')):<20s}",
+        header = "  ".join(map(_CELL_FMT, keys))
+        lines += [f"\n  {header}", f"  {_SUB_SEP}"]
+        lines.extend(map(
+            lambda rec: "  " + "  ".join(map(
+                lambda k: _CELL_FMT(_format_value(rec.get(k, ''))),
                 keys,
-            ))),
+            )),
             records,
         ))
-        print()
+        lines.append("")
+        print("\n".join(lines))
 
     def write_chart(
         self,
@@ -59,24 +61,25 @@ class ConsoleWriter:
         title: str = "",
         options: Optional[Dict[str, Any]] = None,
     ) -> None:
-        print(f"\n  [CHART: {chart_type}] {title}")
+        lines = [f"\n  [CHART: {chart_type}] {title}"]
         labels = data.get('labels', [])
         values = data.get('values', [])
         if labels and values:
-            list(map(
-                lambda pair: print(f"    {pair[0]:<30s} {_format_value(pair[1])}"),
+            lines.extend(map(
+                lambda pair: _CHART_ROW_FMT(pair[0], _format_value(pair[1])),
                 zip(labels, values),
             ))
-        print()
+        lines.append("")
+        print("\n".join(lines))
 
     def write_summary(self, summary: Dict[str, Any], title: str = "") -> None:
-        if title:
-            print(f"\n  --- {title} ---")
-        list(map(
-            lambda kv: print(f"    {kv[0]:<25s}: {_format_value(kv[1])}"),
+        lines = [f"\n  --- {title} ---"] if title else []
+        lines.extend(map(
+            lambda kv: _SUMMARY_ROW_FMT(kv[0], _format_value(kv[1])),
             summary.items(),
         ))
-        print()
+        lines.append("")
+        print("\n".join(lines))
 
 
 class GraphicsChartWriter:
@@ -106,6 +109,7 @@ class GraphicsChartWriter:
         self._text_color = colors_cfg.get('text_primary', '#e7e9ea')
         self._secondary_color = colors_cfg.get('text_secondary', '#71767b')
 
+        import matplotlib.pyplot as plt
         plt.style.use(self._style)
 
     def write(self, records: List[Dict[str, Any]], title: str = "") -> None:
@@ -142,6 +146,7 @@ class GraphicsChartWriter:
         title: str = "",
         options: Optional[Dict[str, Any]] = None,
     ) -> None:
+        import matplotlib.pyplot as plt
         opts = options or {}
         dispatch = {
             'bar': self._draw_bar,
@@ -159,6 +164,7 @@ class GraphicsChartWriter:
         plt.close(fig)
 
     def write_summary(self, summary: Dict[str, Any], title: str = "") -> None:
+        import matplotlib.pyplot as plt
         fig, ax = plt.subplots(figsize=(10, 4))
         self._style_figure(fig)
         ax.axis('off')
@@ -264,7 +270,7 @@ class GraphicsChartWriter:
         ax.set_xticklabels(xlabels, rotation=45, ha='right')
         ax.set_yticks(range(len(ylabels)))
         ax.set_yticklabels(ylabels)
-        plt.colorbar(im, ax=ax)
+        ax.figure.colorbar(im, ax=ax)
 
     def _save_figure(self, fig, title: str) -> None:
         self._chart_count += 1
@@ -288,10 +294,13 @@ class TkinterSink:
         self._viz_frame = None
         self._stats_text = None
         self._notebook = None
+        self._fig = None
+        self._canvas = None
 
         viz = self.config.get('visualization', {})
         self._fig_size = tuple(viz.get('figure_size', [12, 6]))
         self._style = viz.get('style', 'dark_background')
+        self._style_applied = False
         self._bg_color = viz.get('chart_bg_color', '#000000')
         self._face_color = viz.get('chart_face_color', '#000000')
         self._grid_color = viz.get('grid_color', '#2f3336')
@@ -312,6 +321,8 @@ class TkinterSink:
         self._viz_frame = viz_frame
         self._stats_text = stats_text
         self._notebook = notebook
+        self._fig = None
+        self._canvas = None
 
     def write(self, records: List[Dict[str, Any]], title: str = "") -> None:
         if not records:
@@ -365,7 +376,7 @@ class TkinterSink:
 
     def write_summary(self, summary: Dict[str, Any], title: str = "") -> None:
         lines = list(map(
-            lambda kv: f"    {kv[0]:<25s}: {_format_value(kv[1])}",
+            lambda kv: _SUMMARY_ROW_FMT(kv[0], _format_value(kv[1])),
             summary.items(),
         ))
         block = (
@@ -375,14 +386,13 @@ class TkinterSink:
         self._write_stats("\n".join(block))
 
     def _append_stats_table(self, records, keys, title) -> None:
-        import tkinter as tk
         if self._stats_text is None:
             return
 
-        header_line = "  ".join(map(lambda k: f"{k:<20s}", keys))
+        header_line = "  ".join(map(_CELL_FMT, keys))
         row_lines = list(map(
             lambda rec: "  ".join(map(
-                lambda k: f"{_format_value(rec.get(k, '')):<20s}", keys,
+                lambda k: _CELL_FMT(_format_value(rec.get(k, ''))), keys,
             )),
             records,
         ))
@@ -392,10 +402,7 @@ class TkinterSink:
             + list(map(lambda r: f"  {r}", row_lines))
             + [""]
         )
-        text = "\n".join(block)
-        self._stats_text.config(state=tk.NORMAL)
-        self._stats_text.insert(tk.END, text)
-        self._stats_text.config(state=tk.DISABLED)
+        self._write_stats("\n".join(block))
 
     def _write_stats(self, text: str) -> None:
         import tkinter as tk
@@ -406,14 +413,26 @@ class TkinterSink:
         self._stats_text.config(state=tk.DISABLED)
 
     def _render_chart(self, chart_type, labels, values, title, value_key='gdp') -> None:
-        import tkinter as tk
         if self._viz_frame is None:
             return
-
-        list(map(lambda w: w.destroy(), self._viz_frame.winfo_children()))
-
-        plt.style.use(self._style)
-        fig = Figure(figsize=self._fig_size)
+        import tkinter as tk
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        if not self._style_applied:
+            import matplotlib.style
+            matplotlib.style.use(self._style)
+            self._style_applied = True
+        if self._canvas is None or not self._canvas.get_tk_widget().winfo_exists():
+            list(map(lambda w: w.destroy(), self._viz_frame.winfo_children()))
+            self._fig = Figure(figsize=self._fig_size)
+            self._canvas = FigureCanvasTkAgg(self._fig, master=self._viz_frame)
+            widget = self._canvas.get_tk_widget()
+            widget.configure(bg=self.config.get('colors', {}).get('dark', '#000000'))
+            widget.pack(fill=tk.BOTH, expand=True)
+
+        fig = self._fig
+        fig.clf()
         fig.patch.set_facecolor(self._face_color)
         ax = fig.add_subplot(111)
 
@@ -437,19 +456,23 @@ class TkinterSink:
             ax.set_title(title, color=self._text_color, fontsize=self._title_size, pad=15)
         ax.grid(True, alpha=self._grid_alpha, color=self._grid_color)
 
-        fig.tight_layout()
-
-        colors_cfg = self.config.get('colors', {})
-        canvas = FigureCanvasTkAgg(fig, master=self._viz_frame)
-        canvas.draw()
-        widget = canvas.get_tk_widget()
-        widget.configure(bg=colors_cfg.get('dark', '#000000'))
-        widget.pack(fill=tk.BOTH, expand=True)
+        margins = dict(_TK_MARGINS.get(chart_type, _TK_MARGINS['bar']))
+        if drawer == self._draw_bar:
+            margins['left'] = self._bar_left_margin(fig, labels)
+        fig.subplots_adjust(**margins)
+        self._canvas.draw_idle()
 
         if self._notebook is not None:
             self._notebook.select(self._viz_frame)
 
+    def _bar_left_margin(self, fig, labels) -> float:
+        # Widen the fixed margin to fit the longest y tick label (~0.6em per char).
+        longest = max(map(lambda label: len(str(label)), labels), default=0)
+        needed = (longest * 0.6 * self._tick_size + 14) / (fig.get_figwidth() * 72)
+        return min(max(needed, _TK_MARGINS['bar']['left']), 0.6)
+
     def _draw_bar(self, ax, labels, values, value_key) -> None:
+        from matplotlib.ticker import FuncFormatter
         colors = list(map(
             lambda i: self._palette[i % len(self._palette)],
             range(len(labels)),
@@ -0,0 +1,95 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from data_loader import ConfigLoader, _sidecar_is_fresh, _source_stamp
+
+
+def _minimal_config(file_path='data.xlsx'):
+    return {
+        'data': {'file_path': file_path, 'required_columns': ['Country Name']},
+        'ui': {},
+        'colors': {},
+        'analysis_types': [],
+        'visualization': {},
+    }
+
+
+class _TempDirTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def _write(self, name, content, mtime_ns=None):
+        path = os.path.join(self.tmp, name)
+        mode = 'wb' if isinstance(content, bytes) else 'w'
+        with open(path, mode) as f:
+            f.write(content)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+
+class TestConfigLoaderCache(_TempDirTestCase):
+
+    def test_loaders_get_independent_configs(self):
+        path = self._write('config.json', json.dumps(_minimal_config()))
+        first = ConfigLoader(path)
+        first.config['data']['file_path'] = 'changed.xlsx'
+        first.config['ui']['title'] = 'Edited'
+
+        second = ConfigLoader(path)
+        self.assertEqual(second.get('data', 'file_path'), 'data.xlsx')
+        self.assertNotIn('title', second.get('ui'))
+
+    def test_changed_file_is_reread(self):
+        path = self._write('config.json', json.dumps(_minimal_config()), mtime_ns=1_000_000_000)
+        self.assertEqual(ConfigLoader(path).get('data', 'file_path'), 'data.xlsx')
+
+        self._write('config.json', json.dumps(_minimal_config('other.xlsx')), mtime_ns=2_000_000_000)
+        self.assertEqual(ConfigLoader(path).get('data', 'file_path'), 'other.xlsx')
+
+    def test_missing_sections_are_reported_in_order(self):
+        config = _minimal_config()
+        del config['ui'], config['visualization']
+        path = self._write('config.json', json.dumps(config))
+        with self.assertRaisesRegex(Exception, 'section: ui, visualization'):
+            ConfigLoader(path)
+
+
+class TestParquetSidecar(_TempDirTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.source = self._write('data.xlsx', b'workbook v1', mtime_ns=2_000_000_000)
+        self.cache = self._write('data.xlsx.parquet', b'parquet')
+
+    def _stamp(self):
+        self._write('data.xlsx.parquet.stamp', _source_stamp(self.source))
+
+    def test_fresh_when_stamp_matches(self):
+        self._stamp()
+        self.assertTrue(_sidecar_is_fresh(self.source, self.cache))
+
+    def test_stale_without_stamp_or_cache(self):
+        self.assertFalse(_sidecar_is_fresh(self.source, self.cache))
+        self._stamp()
+        os.remove(self.cache)
+        self.assertFalse(_sidecar_is_fresh(self.source, self.cache))
+
+    def test_stale_when_source_replaced_with_older_mtime(self):
+        self._stamp()
+        self._write('data.xlsx', b'workbook v2 restored', mtime_ns=1_000_000_000)
+        self.assertFalse(_sidecar_is_fresh(self.source, self.cache))
+
+    def test_stale_when_size_changes_with_same_mtime(self):
+        self._stamp()
+        self._write('data.xlsx', b'workbook v1 + more', mtime_ns=2_000_000_000)
+        self.assertFalse(_sidecar_is_fresh(self.source, self.cache))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from data_processor import (
+    GDPDataProcessor,
+    _growth_series,
+    _growth_series_numpy,
+    _pairwise_corr,
+    _pairwise_corr_numpy,
+    calculate_country_average,
+    calculate_country_sum,
+    calculate_regional_average,
+    calculate_regional_sum,
+    filter_by_country,
+    filter_by_region,
+)
+
+
+YEARS = list(range(2000, 2012))
+
+
+def _make_frame():
+    rng = np.random.default_rng(0)
+    values = rng.uniform(1e9, 5e12, size=(12, len(YEARS)))
+    values[1, 3:6] = np.nan
+    values[4, :] = np.nan
+    values[7, 0] = 0.0
+    values[9, -1] = np.nan
+    values[10, 5] = values[11, 5]
+
+    df = pd.DataFrame(values, columns=YEARS)
+    df.insert(0, 'Country Name', [f'Country {i}' for i in range(12)])
+    df.insert(1, 'Continent', ['Asia', 'Europe', 'Africa'] * 4)
+    df['Country Name'] = df['Country Name'].astype('category')
+    df['Continent'] = df['Continent'].astype('category')
+    return df
+
+
+def _expected_growth(values):
+    prev, curr = pd.Series(values[:-1]), pd.Series(values[1:])
+    return ((curr - prev) / prev * 100).where(prev != 0).to_numpy()
+
+
+class TestGDPDataProcessor(unittest.TestCase):
+
+    def setUp(self):
+        self.df = _make_frame()
+        self.processor = GDPDataProcessor(self.df, YEARS)
+        self.indexed = self.df.set_index('Country Name')
+
+    def test_get_countries_data_matches_loc(self):
+        countries = ['Country 3', 'Missing', 'Country 1', 'Country 3']
+        for years in (YEARS, YEARS[2:7], YEARS[::3]):
+            found, block = self.processor.get_countries_data(countries, years)
+            self.assertEqual(found, ['Country 3', 'Country 1'])
+            expected = self.indexed.loc[found, years].to_numpy(dtype=np.float64)
+            np.testing.assert_array_equal(block, expected)
+
+    def test_get_top_in_continent_matches_nlargest(self):
+        for continent in ('Asia', 'Europe', 'Africa', 'Nowhere'):
+            for year in (YEARS[0], YEARS[5], YEARS[-1]):
+                for n in (0, 1, 3, 10):
+                    result = self.processor.get_top_in_continent(continent, year, n)
+                    expected = self.df[self.df['Continent'] == continent].nlargest(n, year)
+                    pd.testing.assert_frame_equal(result, expected)
+
+    def test_get_continent_totals_matches_groupby(self):
+        sums = self.df.groupby('Continent', observed=True)[YEARS].sum()
+        for continent in sums.index:
+            totals = self.processor.get_continent_totals(continent, YEARS[1:8])
+            np.testing.assert_allclose(totals.to_numpy(), sums.loc[continent, YEARS[1:8]].to_numpy())
+
+    def test_totals_and_averages_match_pandas(self):
+        asia = self.processor.get_continent_data('Asia')
+        edited = asia.copy()
+        edited[YEARS[4]] = 1.0
+        frames = {
+            'own frame': self.df,
+            'continent copy': asia,
+            'reset index': asia.reset_index(drop=True),
+            'edited copy': edited,
+        }
+        for name, frame in frames.items():
+            for years in (YEARS, YEARS[3:6], YEARS[::4]):
+                with self.subTest(frame=name, years=years):
+                    totals = self.processor.calculate_total_gdp(frame, years)
+                    np.testing.assert_allclose(totals.to_numpy(), frame[years].sum().to_numpy(), rtol=1e-6)
+                    averages = self.processor.calculate_average_gdp(frame, years)
+                    self.assertTrue(averages.index.equals(frame.index))
+                    np.testing.assert_allclose(
+                        averages.to_numpy(), frame[years].mean(axis=1).to_numpy(), rtol=1e-6
+                    )
+
+    def test_cached_results_are_not_shared(self):
+        asia = self.processor.get_continent_data('Asia')
+        asia['extra'] = 1
+        self.assertNotIn('extra', self.processor.get_continent_data('Asia').columns)
+
+        countries = ['Country 0', 'Country 1', 'Country 2']
+        corr = self.processor.get_correlation_matrix(countries, YEARS)
+        corr.iloc[0, 1] = 5.0
+        self.assertNotEqual(self.processor.get_correlation_matrix(countries, YEARS).iloc[0, 1], 5.0)
+
+    def test_summaries_are_not_shared(self):
+        summary = self.processor.get_continent_summary('Asia', YEARS[2])
+        summary['total_gdp'] = -1.0
+        summary['top_countries'].iloc[0, 2] = -1.0
+        fresh = self.processor.get_continent_summary('Asia', YEARS[2])
+        self.assertNotEqual(fresh['total_gdp'], -1.0)
+        self.assertNotEqual(fresh['top_countries'].iloc[0, 2], -1.0)
+
+        stats = self.processor.get_world_statistics(YEARS[2])
+        stats['total_gdp'] = -1.0
+        self.assertNotEqual(self.processor.get_world_statistics(YEARS[2])['total_gdp'], -1.0)
+
+    def test_get_top_countries_keeps_missing_rows_like_nlargest(self):
+        year = YEARS[-1]
+        for n in (3, 11, 12, 20):
+            result = self.processor.get_top_countries(year, n)
+            expected = self.df.sort_values(year, ascending=False, kind='stable', na_position='last').head(n)
+            pd.testing.assert_frame_equal(result, expected)
+
+    def test_get_correlation_matrix_matches_pandas(self):
+        for countries in (['Country 0', 'Country 2', 'Country 3'], ['Country 0', 'Country 1', 'Country 9']):
+            result = self.processor.get_correlation_matrix(countries, YEARS)
+            expected = self.indexed.loc[countries, YEARS].T.astype(np.float64).corr()
+            np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-12)
+
+
+class TestModuleHelpers(unittest.TestCase):
+
+    def setUp(self):
+        self.df = _make_frame()
+
+    def test_results_follow_in_place_edits(self):
+        years = YEARS[:4]
+        before = calculate_regional_sum(self.df, 'Asia', years)
+        country_before = calculate_country_sum(self.df, 'Country 0', years)
+
+        self.df.loc[self.df['Country Name'] == 'Country 0', years] += 1e9
+        self.assertAlmostEqual(calculate_regional_sum(self.df, 'Asia', years), before + 4e9, delta=1.0)
+        self.assertAlmostEqual(calculate_country_sum(self.df, 'Country 0', years), country_before + 4e9, delta=1.0)
+        self.assertAlmostEqual(
+            calculate_country_average(self.df, 'Country 0', years),
+            self.df.loc[0, years].mean(),
+        )
+        self.assertAlmostEqual(
+            calculate_regional_average(self.df, 'Asia', years),
+            self.df[self.df['Continent'] == 'Asia'][years].fillna(0).sum().mean(),
+        )
+
+    def test_filters_see_appended_rows(self):
+        self.assertEqual(len(filter_by_region(self.df, 'Asia')), 4)
+        self.assertTrue(filter_by_country(self.df, 'Country 12').empty)
+
+        self.df.loc[len(self.df)] = ['Country 12', 'Asia'] + [1.0] * len(YEARS)
+        self.assertEqual(len(filter_by_region(self.df, 'Asia')), 5)
+        self.assertEqual(len(filter_by_country(self.df, 'Country 12')), 1)
+
+
+class TestKernels(unittest.TestCase):
+
+    def setUp(self):
+        self.matrix = _make_frame()[YEARS].to_numpy(dtype=np.float64)
+
+    def test_pairwise_corr_matches_pandas(self):
+        rows = [0, 1, 4, 7, 9]
+        for years in (slice(None), slice(2, 8), slice(0, 1)):
+            sub = np.ascontiguousarray(self.matrix[rows, years])
+            expected = pd.DataFrame(sub.T).corr().to_numpy()
+            for kernel in (_pairwise_corr, _pairwise_corr_numpy):
+                with self.subTest(kernel=kernel.__name__, years=years):
+                    np.testing.assert_allclose(kernel(sub), expected, atol=1e-12)
+
+    def test_growth_series_matches_pandas(self):
+        series = list(self.matrix) + [np.array([]), np.array([5.0]), np.array([0.0, 2.0, np.nan, 4.0])]
+        for values in series:
+            expected = _expected_growth(values)
+            for kernel in (_growth_series, _growth_series_numpy):
+                np.testing.assert_allclose(kernel(values.copy()), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+
+from core.engine import TransformationEngine, _params_key
+
+
+YEARS = list(range(2000, 2006))
+
+
+class _NullSink:
+
+    def write(self, records, title=""):
+        pass
+
+    def write_chart(self, chart_type, data, title="", options=None):
+        pass
+
+    def write_summary(self, summary, title=""):
+        pass
+
+
+def _make_records():
+    records = []
+    for i in range(6):
+        record = {'Country Name': f'Country {i}', 'Continent': ['Asia', 'Europe'][i % 2]}
+        record.update({year: float((i + 1) * 1e9 + (year - 2000) * 1e8) for year in YEARS})
+        records.append(record)
+    return records
+
+
+class TestRunAnalysisCache(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = TransformationEngine(_NullSink())
+        self.engine.load_data(_make_records())
+        self.params = {'continent': 'Asia', 'year': YEARS[-1], 'top_n': 2}
+
+    def test_cached_results_are_copies(self):
+        first = self.engine.run_analysis('top_countries', self.params)
+        first[0]['gdp'] = -1.0
+        first.append({'rank': 99})
+
+        second = self.engine.run_analysis('top_countries', self.params)
+        self.assertEqual(len(second), 2)
+        self.assertNotEqual(second[0]['gdp'], -1.0)
+
+    def test_list_params_share_a_cache_entry(self):
+        self.assertEqual(
+            _params_key({'date_range': [2000, 2005]}),
+            _params_key({'date_range': (2000, 2005)}),
+        )
+        self.engine.run_analysis('growth_rate', {'continent': 'Asia', 'date_range': [2000, 2005]})
+        self.engine.run_analysis('growth_rate', {'continent': 'Asia', 'date_range': [2000, 2005]})
+        self.assertEqual(len(self.engine._results), 1)
+
+    def test_unhashable_params_run_uncached(self):
+        params = {'continent': 'Asia', 'date_range': [2000, 2005], 'extra': {'nested': 1}}
+        self.assertIsNone(_params_key(params))
+
+        result = self.engine.run_analysis('growth_rate', params)
+        expected = self.engine.run_analysis('growth_rate', {'continent': 'Asia', 'date_range': [2000, 2005]})
+        self.assertEqual(result, expected)
+        self.assertNotIn(None, map(lambda key: key[1], self.engine._results))
+
+    def test_load_data_clears_cache(self):
+        before = self.engine.run_analysis('top_countries', self.params)
+        records = _make_records()
+        records[0][YEARS[-1]] = 1e15
+        self.engine.load_data(records)
+
+        after = self.engine.run_analysis('top_countries', self.params)
+        self.assertNotEqual(before[0]['country'], after[0]['country'])
+        self.assertEqual(after[0]['country'], 'Country 0')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import sys
+import unittest
+from types import ModuleType
+from unittest import mock
+
+from plugins.outputs import TkinterSink, _TK_MARGINS
+
+
+def _fake_matplotlib():
+    modules = {name: ModuleType(name) for name in (
+        'matplotlib', 'matplotlib.style', 'matplotlib.figure', 'matplotlib.ticker',
+        'matplotlib.backends', 'matplotlib.backends.backend_tkagg',
+    )}
+    modules['matplotlib'].style = modules['matplotlib.style']
+    modules['matplotlib.style'].use = mock.Mock()
+    modules['matplotlib.figure'].Figure = mock.Mock(
+        side_effect=lambda figsize: mock.MagicMock(get_figwidth=mock.Mock(return_value=figsize[0]))
+    )
+    modules['matplotlib.ticker'].FuncFormatter = mock.Mock()
+    modules['matplotlib.backends.backend_tkagg'].FigureCanvasTkAgg = mock.MagicMock()
+    return modules
+
+
+class TestTkinterSinkRenderChart(unittest.TestCase):
+
+    def setUp(self):
+        self.modules = _fake_matplotlib()
+        patcher = mock.patch.dict(sys.modules, self.modules)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.sink = TkinterSink({'visualization': {'figure_size': [12, 6]}})
+        self.viz_frame = mock.MagicMock()
+        self.viz_frame.winfo_children.return_value = []
+        self.notebook = mock.MagicMock()
+        self.sink.bind(self.viz_frame, None, self.notebook)
+
+    def _render(self, chart_type='bar', labels=('A', 'B')):
+        self.sink._render_chart(chart_type, list(labels), [1.0] * len(labels), 'Title')
+
+    def _margins(self):
+        return self.sink._fig.subplots_adjust.call_args.kwargs
+
+    def test_selects_visualization_tab(self):
+        for chart_type in ('bar', 'line', 'pie'):
+            self.notebook.reset_mock()
+            self._render(chart_type)
+            self.notebook.select.assert_called_once_with(self.viz_frame)
+            self.sink._canvas.draw_idle.assert_called()
+
+    def test_bar_left_margin_fits_long_labels(self):
+        self._render(labels=('A', 'B'))
+        self.assertEqual(self._margins()['left'], _TK_MARGINS['bar']['left'])
+
+        self._render(labels=('Short', 'Micronesia, Fed. Sts. and Other Small States'))
+        self.assertGreater(self._margins()['left'], _TK_MARGINS['bar']['left'])
+        self.assertLessEqual(self._margins()['left'], 0.6)
+
+    def test_other_charts_keep_fixed_margins(self):
+        for chart_type in ('line', 'pie'):
+            self._render(chart_type, labels=('A very long label ' * 4,))
+            self.assertEqual(self._margins(), _TK_MARGINS[chart_type])
+
+    def test_figure_canvas_and_style_are_reused(self):
+        self._render()
+        self._render('line')
+        self.assertEqual(self.modules['matplotlib.figure'].Figure.call_count, 1)
+        canvas_cls = self.modules['matplotlib.backends.backend_tkagg'].FigureCanvasTkAgg
+        self.assertEqual(canvas_cls.call_count, 1)
+        self.modules['matplotlib.style'].use.assert_called_once_with('dark_background')
+
+    def test_unbound_sink_does_nothing(self):
+        sink = TkinterSink()
+        sink._render_chart('bar', ['A'], [1.0], 'Title')
+        self.assertIsNone(sink._fig)
+        self.assertEqual(self.modules['matplotlib.figure'].Figure.call_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()